@@ -5,9 +5,12 @@ Press 'A' to toggle the secret bot.
 
 import os
 import random
-import time
+from time import monotonic as _now
 import wave
-from PIL import Image as PILImage
+
+from kivy.config import Config
+# must be set before the window and clock are created
+Config.set('graphics', 'maxfps', '60')
 
 from kivy.app import App
 from kivy.clock import Clock
@@ -15,7 +18,8 @@ from kivy.core.window import Window
 from kivy.graphics import Color, Rectangle
 from kivy.properties import NumericProperty, BooleanProperty, StringProperty
 from kivy.uix.widget import Widget
-from kivy.uix.image import Image
+from kivy.core.image import Image as CoreImage
+from kivy.core.text import Label as CoreLabel
 from kivy.uix.label import Label
 from kivy.uix.button import Button
 
@@ -24,16 +28,6 @@ try:
     from kivy.core.audio import SoundLoader
 except Exception:
     SoundLoader = None
-try:
-    import simpleaudio as sa
-except Exception:
-    sa = None
-try:
-    import pygame
-    pygame_mixer_available = True
-except Exception:
-    pygame = None
-    pygame_mixer_available = False
 if os.name == 'nt':
     try:
         import winsound
@@ -41,10 +35,6 @@ if os.name == 'nt':
         winsound = None
 else:
     winsound = None
-try:
-    from pydub import AudioSegment
-except Exception:
-    AudioSegment = None
 
 # -------------------------
 # Window / baseline values
@@ -62,6 +52,10 @@ IMAGE_CONVERT_SIZE = (64, 64)
 WHITE_THRESHOLD = 240
 MIN_FLAP_INTERVAL = 0.18
 PIPE_MIN_GAP_Y = 60
+AUTOPLAY_MAX_FLAPS = 3
+PIPE_PARK_X = -9999
+KEY_SPACE = 32
+KEY_A = 97
 
 # Difficulty sets — kept the larger gaps from last step
 EASY = {
@@ -82,28 +76,34 @@ RAMP_MAX_GAP_REDUCTION = 50
 # -------------------------
 # Helpers: image conversion
 # -------------------------
+# 8-bit lookup table for Image.point: 255 where a channel counts as white
+WHITE_LUT = [255 if v >= WHITE_THRESHOLD else 0 for v in range(256)]
+
+def png_is_fresh(png_path, jpg_path):
+    return os.path.exists(png_path) and (
+        not os.path.exists(jpg_path) or os.path.getmtime(png_path) >= os.path.getmtime(jpg_path))
+
 def convert_jpg_to_png_with_transparency(folder, jpg_name='bird_face.jpg'):
     jpg_path = os.path.join(folder, jpg_name)
     png_name = os.path.splitext(jpg_name)[0] + '.png'
     png_path = os.path.join(folder, png_name)
-    if os.path.exists(png_path):
+    if png_is_fresh(png_path, jpg_path):
         return png_path
     if not os.path.exists(jpg_path):
         return None
     try:
+        from PIL import Image as PILImage, ImageChops
         img = PILImage.open(jpg_path).convert("RGBA")
         img.thumbnail(IMAGE_CONVERT_SIZE, PILImage.LANCZOS)
         bg = PILImage.new("RGBA", IMAGE_CONVERT_SIZE, (0, 0, 0, 0))
         x = (IMAGE_CONVERT_SIZE[0] - img.width) // 2
         y = (IMAGE_CONVERT_SIZE[1] - img.height) // 2
         bg.paste(img, (x, y), img)
-        new_pixels = []
-        for (r, g, b, a) in bg.getdata():
-            if r >= WHITE_THRESHOLD and g >= WHITE_THRESHOLD and b >= WHITE_THRESHOLD:
-                new_pixels.append((255, 255, 255, 0))
-            else:
-                new_pixels.append((r, g, b, a))
-        bg.putdata(new_pixels)
+        # key out near-white pixels inside PIL: per-channel threshold LUTs
+        # multiplied together give a 255 mask where all of r, g, b are white
+        r, g, b, _ = bg.split()
+        mask = ImageChops.multiply(ImageChops.multiply(r.point(WHITE_LUT), g.point(WHITE_LUT)), b.point(WHITE_LUT))
+        bg.paste((255, 255, 255, 0), (0, 0) + IMAGE_CONVERT_SIZE, mask)
         bg.save(png_path, "PNG")
         print("[Image] Converted JPG -> PNG:", png_path)
         return png_path
@@ -126,7 +126,9 @@ def is_standard_pcm_wav(path):
         return False
 
 def transcode_to_pcm_wav(original_path, out_path):
-    if AudioSegment is None:
+    try:
+        from pydub import AudioSegment
+    except Exception:
         print("[Sound] pydub not installed; cannot transcode automatically.")
         return False
     try:
@@ -139,57 +141,79 @@ def transcode_to_pcm_wav(original_path, out_path):
         print("[Sound] Transcode error:", e)
         return False
 
-def make_play_wrappers(path):
-    wrappers = {}
-    if SoundLoader:
-        try:
-            s = SoundLoader.load(path)
-            if s: wrappers['kivy'] = s
-        except: pass
-    if sa:
-        try:
-            wave_obj = sa.WaveObject.from_wave_file(path)
-            class SAWrap:
-                def __init__(self, wobj):
-                    self.wobj = wobj
-                    self._play = None
-                def play(self):
-                    try: self._play = self.wobj.play()
-                    except: pass
-                def stop(self):
-                    try: self._play.stop()
-                    except: pass
-            wrappers['simpleaudio'] = SAWrap(wave_obj)
-        except: pass
-    if pygame:
-        try:
-            if not pygame.mixer.get_init(): pygame.mixer.init()
-            snd = pygame.mixer.Sound(path)
-            class PygWrap:
-                def __init__(self, s):
-                    self.s = s
-                    self.chan = None
-                def play(self):
-                    try: self.chan = self.s.play()
-                    except: pass
-                def stop(self):
-                    try: self.chan.stop()
-                    except: pass
-            wrappers['pygame'] = PygWrap(snd)
-        except: pass
-    if winsound:
+# Each loader returns a play/stop wrapper, or None if its backend is unavailable.
+# Heavy audio libraries are only imported when their loader is actually tried.
+def _load_kivy_sound(path):
+    if not SoundLoader:
+        return None
+    return SoundLoader.load(path)
+
+def _load_simpleaudio_sound(path):
+    import simpleaudio as sa
+    wave_obj = sa.WaveObject.from_wave_file(path)
+    class SAWrap:
+        def __init__(self, wobj):
+            self.wobj = wobj
+            self._play = None
+        def play(self):
+            try: self._play = self.wobj.play()
+            except: pass
+        def stop(self):
+            try: self._play.stop()
+            except: pass
+    return SAWrap(wave_obj)
+
+def _load_pygame_sound(path):
+    import pygame
+    if not pygame.mixer.get_init():
+        # larger buffer avoids underrun stutter while the game loop is busy
+        pygame.mixer.pre_init(44100, -16, 2, 4096)
+        pygame.mixer.init()
+        pygame.mixer.set_num_channels(8)
+    snd = pygame.mixer.Sound(path)
+    class PygWrap:
+        def __init__(self, s):
+            self.s = s
+            self.chan = None
+        def play(self):
+            try: self.chan = self.s.play()
+            except: pass
+        def stop(self):
+            try: self.chan.stop()
+            except: pass
+    return PygWrap(snd)
+
+def _load_winsound_sound(path):
+    if not winsound:
+        return None
+    class WinWrap:
+        def __init__(self, p): self.p = p
+        def play(self):
+            try: winsound.PlaySound(self.p, winsound.SND_ASYNC | winsound.SND_FILENAME)
+            except: pass
+        def stop(self):
+            try: winsound.PlaySound(None, winsound.SND_PURGE)
+            except: pass
+    return WinWrap(path)
+
+SOUND_BACKEND_PRIORITY = (
+    ('kivy', _load_kivy_sound),
+    ('simpleaudio', _load_simpleaudio_sound),
+    ('pygame', _load_pygame_sound),
+    ('winsound', _load_winsound_sound),
+)
+
+def load_sound(path):
+    # stop at the first backend that loads, so later ones are never imported or opened
+    for name, loader in SOUND_BACKEND_PRIORITY:
         try:
-            class WinWrap:
-                def __init__(self, p): self.p = p
-                def play(self):
-                    try: winsound.PlaySound(self.p, winsound.SND_ASYNC | winsound.SND_FILENAME)
-                    except: pass
-                def stop(self):
-                    try: winsound.PlaySound(None, winsound.SND_PURGE)
-                    except: pass
-            wrappers['winsound'] = WinWrap(path)
-        except: pass
-    return wrappers
+            snd = loader(path)
+        except Exception:
+            snd = None
+        if snd:
+            print("[Sound] Using backend:", name)
+            return snd
+    return DummySound()
 
 # -------------------------
 # Game classes
@@ -202,21 +226,24 @@ class Bird(Widget):
         self.size = BIRD_SIZE
         self.size_hint = (None, None)
         self.source = source or ''
-        self._image_widget = None
-        self._rect = None
+        texture = None
         if self.source and os.path.exists(self.source):
-            self._image_widget = Image(source=self.source, size=self.size, size_hint=(None, None))
-            self.add_widget(self._image_widget)
-        else:
-            with self.canvas:
+            try:
+                texture = CoreImage(self.source).texture
+            except Exception as e:
+                print("[Image] Bird texture load error:", e)
+        with self.canvas:
+            if texture is not None:
+                Color(1, 1, 1, 1)
+                self._rect = Rectangle(texture=texture, pos=self.pos, size=self.size)
+            else:
                 Color(1, 0.6, 0.2, 1)
                 self._rect = Rectangle(pos=self.pos, size=self.size)
-        self.bind(pos=self._update_graphics, size=self._update_graphics)
+        self.bind(pos=self._update_graphics, size=self._update_size)
     def _update_graphics(self, *a):
-        if self._image_widget:
-            self._image_widget.pos, self._image_widget.size = self.pos, self.size
-        elif self._rect:
-            self._rect.pos, self._rect.size = self.pos, self.size
+        self._rect.pos = self.pos
+    def _update_size(self, *a):
+        self._rect.size = self.size
     def physics_step(self, dt):
         self.velocity += GRAVITY * dt
         self.y += self.velocity * dt
@@ -228,20 +255,28 @@ class PipePair(Widget):
     scored = BooleanProperty(False)
     def __init__(self, x, gap_y, gap_size, width, screen_height, **kwargs):
         super().__init__(**kwargs)
-        self.x = x
         self.width_pipe = width
-        self.gap_size = gap_size
-        self.gap_y = gap_y
         self.screen_height = screen_height
-        self.bottom_height = gap_y
-        self.top_pos = gap_y + gap_size
-        self.top_height = screen_height - self.top_pos
         with self.canvas:
             Color(0.15, 0.65, 0.2, 1)
-            self._bottom_rect = Rectangle(pos=(self.x, 0), size=(self.width_pipe, self.bottom_height))
-            self._top_rect = Rectangle(pos=(self.x, self.top_pos), size=(self.width_pipe, self.top_height))
+            self._bottom_rect = Rectangle()
+            self._top_rect = Rectangle()
         self.size = (self.width_pipe, screen_height)
+        self.reset(x, gap_y, gap_size)
+    def reset(self, x, gap_y, gap_size):
+        self.x = x
+        self.gap_size = gap_size
+        self.gap_y = gap_y
+        self.bottom_height = gap_y
+        self.top_pos = gap_y + gap_size
+        self.top_height = self.screen_height - self.top_pos
+        self.scored = False
+        self._bottom_rect.pos, self._bottom_rect.size = (self.x, 0), (self.width_pipe, self.bottom_height)
+        self._top_rect.pos, self._top_rect.size = (self.x, self.top_pos), (self.width_pipe, self.top_height)
         self.pos = (self.x, 0)
+    def park(self):
+        # pooled pipes stay attached to the game, just drawn off-screen
+        self.move(PIPE_PARK_X - self.x)
     @property
     def right(self): return self.x + self.width_pipe
     def move(self, dx):
@@ -249,11 +284,10 @@ class PipePair(Widget):
         self._bottom_rect.pos = (self.x, 0)
         self._top_rect.pos = (self.x, self.top_pos)
         self.pos = (self.x, 0)
-    def collides_with(self, bx, by, bw, bh):
-        bx1, by1, bw1, bh1 = self.x, 0, self.width_pipe, self.bottom_height
-        tx1, ty1, tw1, th1 = self.x, self.top_pos, self.width_pipe, self.top_height
-        def aabb(x1,y1,w1,h1, x2,y2,w2,h2): return (x1 < x2 + w2 and x1 + w1 > x2 and y1 < y2 + h2 and y1 + h1 > y2)
-        return aabb(bx, by, bw, bh, bx1, by1, bw1, bh1) or aabb(bx, by, bw, bh, tx1, ty1, tw1, th1)
+    def outside_gap(self, by, by2):
+        # vertical half of the collision test; callers check x overlap first.
+        # The game keeps the bird inside the screen, so only the gap edges matter
+        return by < self.bottom_height or by2 > self.top_pos
 
 # -------------------------
 # Main game widget
@@ -271,8 +305,10 @@ class FlappyGame(Widget):
         self.bind(size=self._update_bg, pos=self._update_bg)
 
         folder = os.path.dirname(os.path.abspath(__file__))
-        converted = convert_jpg_to_png_with_transparency(folder, 'bird_face.jpg')
-        png_path = converted or os.path.join(folder, 'bird_face.png')
+        png_path = os.path.join(folder, 'bird_face.png')
+        # warm start: an up-to-date PNG needs no conversion (and no Pillow import)
+        if not png_is_fresh(png_path, os.path.join(folder, 'bird_face.jpg')):
+            png_path = convert_jpg_to_png_with_transparency(folder, 'bird_face.jpg') or png_path
         bird_source = png_path if os.path.exists(png_path) else None
         self.bird = Bird(source=bird_source)
         self.bird.pos = (100, WINDOW_HEIGHT // 2 - self.bird.height // 2)
@@ -280,6 +316,7 @@ class FlappyGame(Widget):
 
         self.score_label = Label(text="Score: 0", pos=(10, WINDOW_HEIGHT - 40), size_hint=(None, None), font_size=26)
         self.add_widget(self.score_label)
+        self._last_rendered_score = 0
 
         self.start_button = Button(text="Start Game", size_hint=(None, None), size=(160, 60),
                                    pos=(WINDOW_WIDTH / 2 - 80, WINDOW_HEIGHT / 2 - 30))
@@ -295,36 +332,59 @@ class FlappyGame(Widget):
                 fixed = os.path.join(folder, 'sound_transcoded.wav')
                 if transcode_to_pcm_wav(self.sound_path, fixed):
                     self.sound_path = fixed
-        self.sound_wrappers = make_play_wrappers(self.sound_path) if self.sound_path else {}
+        # the backend (and pygame.mixer, if chosen) is opened lazily on the first flap
+        self._sound = None
+        self._play_sfx = self._resolve_play_sfx
 
         self.pipes = []
+        self._pipe_pool = []
+        self._next_pipe_idx = 0
         self._time_since_last_spawn = 0.0
         Window.bind(on_key_down=self._on_key_down)
-        self._update_event = None
-        self._last_flap_time = 0.0
+        self._update_trigger = Clock.create_trigger(self._update, 1.0 / 60.0, interval=True)
+        self._last_flap_time = float('-inf')
 
         # Difficulty initial
         self.current_pipe_speed = EASY['PIPE_SPEED']
         self.current_pipe_gap = EASY['PIPE_GAP']
         self.current_spawn_interval = EASY['PIPE_SPAWN_INTERVAL']
         self.initial_spacing_mult = EASY['INITIAL_SPACING_MULT']
+        # difficulty only depends on score, so recompute it when score changes
+        self.bind(score=lambda *a: self._apply_difficulty())
 
         # Secret autoplay flag
         self.autoplay = False
 
+    @property
+    def sound(self):
+        if self._sound is None:
+            self._sound = load_sound(self.sound_path) if self.sound_path else DummySound()
+        return self._sound
+
+    def _resolve_play_sfx(self):
+        # load the backend once, then rebind _play_sfx to a direct restart
+        snd = self.sound
+        def play():
+            try:
+                snd.stop()
+                snd.play()
+            except: pass
+        self._play_sfx = play
+        play()
+
     def _update_bg(self, *a):
         self._bg.size = self.size
         self._bg.pos = self.pos
 
     def _on_key_down(self, window, key, scancode, codepoint, modifiers):
         # Spacebar: start / flap
-        if key == 32 or codepoint == ' ':
+        if key == KEY_SPACE:
             if not self.running and not self.game_over:
                 self.start_game(None)
             elif self.running:
                 self._flap()
-        # Secret toggle: A or a
-        elif codepoint and codepoint.lower() == 'a':
+        # Secret toggle: A or a (Kivy reports the lowercase keycode either way)
+        elif key == KEY_A:
             self.autoplay = not self.autoplay
             print("[Secret Bot] Autoplay:", self.autoplay)
             if self.autoplay and not self.running and not self.game_over:
@@ -338,7 +398,7 @@ class FlappyGame(Widget):
         return super().on_touch_down(touch)
 
     def _can_flap_now(self):
-        now = time.time()
+        now = _now()
         if now - self._last_flap_time >= MIN_FLAP_INTERVAL:
             self._last_flap_time = now
             return True
@@ -347,66 +407,47 @@ class FlappyGame(Widget):
     def _flap(self):
         if not self._can_flap_now(): return
         self.bird.flap()
-        # play sound using first available wrapper
-        for name in ('kivy','simpleaudio','pygame','winsound'):
-            w = self.sound_wrappers.get(name)
-            if w:
-                try:
-                    if hasattr(w,'stop'): w.stop()
-                    w.play()
-                    break
-                except: pass
+        self._play_sfx()
 
     # -------------------------
     # Predictive multi-flap controller
     # -------------------------
-    def _predict_center_with_flaps(self, time_to_pipe, n_flaps):
+    def _predict_centers(self, time_to_pipe, max_flaps):
         """
-        Predict the bird center at time_to_pipe if we apply n_flaps.
-        Flap schedule: if n_flaps >= 1, first flap at t=0 (now),
+        Predict the bird center at time_to_pipe for every k in 0..max_flaps flaps.
+        Flap schedule: if k >= 1, first flap at t=0 (now),
         further flaps at t = MIN_FLAP_INTERVAL, 2*MIN_FLAP_INTERVAL, ...
+        Every full inter-flap segment climbs the same amount, so each k is
+        evaluated in closed form from the time of its last flap.
         """
-        y = self.bird.y
-        v = self.bird.velocity
-        # build events: flap times (include 0 if n_flaps>=1) and final time
-        events = []
-        if n_flaps >= 1:
-            for i in range(n_flaps):
-                t = i * MIN_FLAP_INTERVAL
-                # don't add flap events beyond time_to_pipe
-                if t < time_to_pipe:
-                    events.append(('flap', t))
-        events.append(('end', time_to_pipe))
-        # ensure events sorted
-        events.sort(key=lambda x: x[1])
-        t_prev = 0.0
-        for event_type, t_event in events:
-            dt = t_event - t_prev
-            # integrate motion for dt
-            # y(t+dt) = y + v*dt + 0.5*g*dt^2
-            y = y + v * dt + 0.5 * GRAVITY * (dt ** 2)
-            # v(t+dt) = v + g*dt
-            v = v + GRAVITY * dt
-            # if this event is a flap (and not the final), set velocity to FLAP_VELOCITY
-            if event_type == 'flap':
-                v = FLAP_VELOCITY
-            t_prev = t_event
-        # return center
-        return y + (self.bird.height / 2.0)
+        y0 = self.bird.y
+        half_h = self.bird.height / 2.0
+        # k = 0: pure ballistic from the current state
+        t = time_to_pipe
+        centers = [y0 + self.bird.velocity * t + 0.5 * GRAVITY * t * t + half_h]
+        seg = FLAP_VELOCITY * MIN_FLAP_INTERVAL + 0.5 * GRAVITY * MIN_FLAP_INTERVAL * MIN_FLAP_INTERVAL
+        n = 0
+        for k in range(1, max_flaps + 1):
+            # flaps at or beyond time_to_pipe are never applied
+            if (k - 1) * MIN_FLAP_INTERVAL < time_to_pipe:
+                n = k
+            if n == 0:
+                centers.append(centers[0])
+                continue
+            dt = time_to_pipe - (n - 1) * MIN_FLAP_INTERVAL
+            centers.append(y0 + (n - 1) * seg + FLAP_VELOCITY * dt + 0.5 * GRAVITY * dt * dt + half_h)
+        return centers
 
     def _autoflap_logic(self):
         # basic guards
         if not self.pipes or not self.running or self.game_over:
             return
 
-        # choose next pipe ahead of the bird (first with right edge ahead)
-        next_pipe = None
-        for p in self.pipes:
-            if p.x + p.width_pipe > self.bird.x:
-                next_pipe = p
-                break
-        if not next_pipe:
+        # next pipe ahead of the bird: pipes are ordered by x and every pipe
+        # before _next_pipe_idx has already been passed (scored)
+        if self._next_pipe_idx >= len(self.pipes):
             return
+        next_pipe = self.pipes[self._next_pipe_idx]
 
         gap_center = next_pipe.gap_y + next_pipe.gap_size / 2.0
         horiz_dist = next_pipe.x - self.bird.x
@@ -414,30 +455,25 @@ class FlappyGame(Widget):
             return
         time_to_pipe = horiz_dist / self.current_pipe_speed
 
-        # try 0..3 flaps and pick the minimal flaps that land inside gap (with margin)
+        # try 0..AUTOPLAY_MAX_FLAPS flaps and pick the minimal flaps that land inside gap (with margin)
         margin = 6.0
-        max_flaps = 3
+        low = gap_center - (next_pipe.gap_size / 2.0) + margin
+        high = gap_center + (next_pipe.gap_size / 2.0) - margin
         chosen_flaps = None
-        for k in range(0, max_flaps + 1):
-            predicted_center = self._predict_center_with_flaps(time_to_pipe, k)
+        # fallback if nothing lands inside the gap: the k that gets closest to its center
+        best_k = None
+        best_dist = float('inf')
+        for k, predicted_center in enumerate(self._predict_centers(time_to_pipe, AUTOPLAY_MAX_FLAPS)):
             # check if predicted center will be inside pipe gap region (allow margin)
-            if (gap_center - (next_pipe.gap_size / 2.0) + margin) <= predicted_center <= (gap_center + (next_pipe.gap_size / 2.0) - margin):
+            if low <= predicted_center <= high:
                 chosen_flaps = k
                 break
-
-        # If chosen_flaps is None, we'll pick the k that gets closest above the lower edge (safer)
+            dist = abs(predicted_center - gap_center)
+            if dist < best_dist:
+                best_dist = dist
+                best_k = k
         if chosen_flaps is None:
-            best_k = None
-            best_dist = float('inf')
-            for k in range(0, max_flaps + 1):
-                predicted_center = self._predict_center_with_flaps(time_to_pipe, k)
-                # distance from gap center
-                dist = abs(predicted_center - gap_center)
-                if dist < best_dist:
-                    best_dist = dist
-                    best_k = k
             chosen_flaps = best_k
-    
 
         # If chosen_flaps >= 1, we need to flap now (first flap at t=0)
         if chosen_flaps is not None and chosen_flaps >= 1:
@@ -454,7 +490,8 @@ class FlappyGame(Widget):
     def start_game(self, instance):
         self.clear_pipes()
         self.score = 0
-        self.score_label.text = "Score: 0"
+        self._apply_difficulty()
+        self._render_score()
         self.game_over = False
         self.running = True
         self._time_since_last_spawn = 0.0
@@ -467,29 +504,42 @@ class FlappyGame(Widget):
         for i in range(2):
             spawn_x = WINDOW_WIDTH + i * spacing
             gap_y = random.randint(PIPE_MIN_GAP_Y + 20, WINDOW_HEIGHT - self.current_pipe_gap - 40)
-            p = PipePair(spawn_x, gap_y, self.current_pipe_gap, int(WINDOW_WIDTH * 0.12), WINDOW_HEIGHT)
-            self.pipes.append(p)
-            self.add_widget(p)
+            self._spawn_pipe(spawn_x, gap_y)
 
-        if self._update_event:
-            Clock.unschedule(self._update_event)
-        self._update_event = Clock.schedule_interval(self._update, 1.0 / 60.0)
+        self._update_trigger.cancel()
+        self._update_trigger()
         print("[Game] Started")
 
+    def _spawn_pipe(self, x, gap_y):
+        # reuse a pooled pipe when possible to avoid rebuilding canvas instructions
+        if self._pipe_pool:
+            p = self._pipe_pool.pop()
+            p.reset(x, gap_y, self.current_pipe_gap)
+        else:
+            p = PipePair(x, gap_y, self.current_pipe_gap, int(WINDOW_WIDTH * 0.12), WINDOW_HEIGHT)
+            self.add_widget(p)
+        self.pipes.append(p)
+
+    def _recycle_pipe(self, p):
+        p.park()
+        self._pipe_pool.append(p)
+
+    def _render_score(self):
+        # label.text triggers a texture rebuild, so only touch it on a change
+        if self.score != self._last_rendered_score:
+            self.score_label.text = f"Score: {self.score}"
+            self._last_rendered_score = self.score
+
     def clear_pipes(self):
-        for p in list(self.pipes):
-            try:
-                self.remove_widget(p)
-            except:
-                pass
+        for p in self.pipes:
+            self._recycle_pipe(p)
         self.pipes = []
+        self._next_pipe_idx = 0
 
     def end_game(self):
         self.game_over = True
         self.running = False
-        if self._update_event:
-            Clock.unschedule(self._update_event)
-            self._update_event = None
+        self._update_trigger.cancel()
         self._game_over_label = Label(text=f"Game Over!\nScore: {self.score}", font_size=32,
                                       halign='center', valign='middle',
                                       size_hint=(None, None), size=(300, 120),
@@ -515,10 +565,9 @@ class FlappyGame(Widget):
             self.initial_spacing_mult = HARD['INITIAL_SPACING_MULT']
 
     def _update(self, dt):
-        if not self.running or self.game_over:
+        if not self.running or self.game_over or dt < 1e-4:
             return
 
-        self._apply_difficulty()
         self.bird.physics_step(dt)
 
         if self.bird.y <= 0:
@@ -530,45 +579,48 @@ class FlappyGame(Widget):
             self.end_game()
             return
 
+        # move, cull, collide and score in one pass over the pipes
         dx = -self.current_pipe_speed * dt
-        for p in list(self.pipes):
+        bx, by = self.bird.x, self.bird.y
+        bx2, by2 = bx + self.bird.width, by + self.bird.height
+        pipes = self.pipes
+        alive = []
+        for i, p in enumerate(pipes):
             p.move(dx)
             if p.right < -50:
-                try:
-                    self.remove_widget(p)
-                except:
-                    pass
-                if p in self.pipes:
-                    self.pipes.remove(p)
+                self._recycle_pipe(p)
+                if p.scored:
+                    self._next_pipe_idx -= 1
+                continue
+            alive.append(p)
+            # only a pipe overlapping the bird in x can collide
+            px = p.x
+            if px < bx2 and px + p.width_pipe > bx and p.outside_gap(by, by2):
+                self.pipes = alive + pipes[i + 1:]
+                self.end_game()
+                return
+            if not p.scored and p.right < bx:
+                p.scored = True
+                self._next_pipe_idx += 1
+                self.score += 1
+                self._render_score()
+        self.pipes = alive
 
         self._time_since_last_spawn += dt
         if self._time_since_last_spawn >= self.current_spawn_interval:
             rightmost = max([p.x for p in self.pipes]) if self.pipes else 0
             spawn_x = max(WINDOW_WIDTH + 20, rightmost + int(WINDOW_WIDTH * 0.7))
             gap_y = random.randint(PIPE_MIN_GAP_Y + 10, WINDOW_HEIGHT - self.current_pipe_gap - 30)
-            new_pipe = PipePair(spawn_x, gap_y, self.current_pipe_gap, int(WINDOW_WIDTH * 0.12), WINDOW_HEIGHT)
-            self.pipes.append(new_pipe)
-            self.add_widget(new_pipe)
+            self._spawn_pipe(spawn_x, gap_y)
             self._time_since_last_spawn = 0.0
 
-        # secret bot
-        if self.autoplay:
+        # secret bot; skip planning entirely while the flap debounce is still active
+        if self.autoplay and _now() - self._last_flap_time >= MIN_FLAP_INTERVAL:
             self._autoflap_logic()
 
-        bx, by, bw, bh = self.bird.x, self.bird.y, self.bird.width, self.bird.height
-        for p in self.pipes:
-            if p.collides_with(bx, by, bw, bh):
-                self.end_game()
-                return
-            if not p.scored and p.right < self.bird.x:
-                p.scored = True
-                self.score += 1
-                self.score_label.text = f"Score: {self.score}"
-
     def on_parent(self, widget, parent):
         if parent is None:
-            if self._update_event:
-                Clock.unschedule(self._update_event)
+            self._update_trigger.cancel()
             Window.unbind(on_key_down=self._on_key_down)
 
 # -------------------------
@@ -577,17 +629,20 @@ class FlappyGame(Widget):
 class SplashScreen(Widget):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        with self.canvas:
-            Color(0, 0, 0, 1)
-            self.rect = Rectangle(pos=(0, 0), size=Window.size)
-        self.label = Label(
+        # render the text once to a texture and draw it directly; no Label widget
+        label = CoreLabel(
             text="THIS GAME IS DEVELOPED AND TESTED BY\nMR ABHIJITH KUMAR",
             halign='center', valign='middle', color=(1, 1, 1, 1),
-            font_size=28, size_hint=(None, None), size=(WINDOW_WIDTH, 120),
-            pos=(0, WINDOW_HEIGHT / 2 - 60)
+            font_size=28, text_size=(WINDOW_WIDTH, 120)
         )
-        self.label.bind(size=lambda inst, val: setattr(inst, 'text_size', val))
-        self.add_widget(self.label)
+        label.refresh()
+        tex = label.texture
+        with self.canvas:
+            Color(0, 0, 0, 1)
+            self.rect = Rectangle(pos=(0, 0), size=Window.size)
+            Color(1, 1, 1, 1)
+            self.text_rect = Rectangle(texture=tex, size=tex.size,
+                                       pos=((WINDOW_WIDTH - tex.width) / 2, (WINDOW_HEIGHT - tex.height) / 2))
 
 # -------------------------
 # App